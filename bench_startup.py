@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark startup time of the converter entry points
+
+Each entry point is run in a fresh interpreter on a path that should never
+need a writer backend (--help, usage errors, empty input). The median wall
+time above a bare ``python -c pass`` is checked against a budget, and the
+writer backends (pandas, xlsxwriter, fpdf) must not have been imported.
+
+Usage:
+    python3 bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+HEAVY_MODULES = ('pandas', 'xlsxwriter', 'fpdf')
+
+# Allowed startup overhead over a bare interpreter, in milliseconds
+BUDGET_MS = {
+    'json2excel.py --help': 60,
+    'json2excel.py <empty dir>': 60,
+    'json2html.py': 40,
+    'json2pdf.py': 40,
+}
+
+# Runs the entry point in-process and reports which heavy modules it loaded
+PROBE = """
+import runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+except SystemExit:
+    pass
+loaded = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write('LOADED:' + ','.join(loaded) + '\\n')
+"""
+
+def time_command(cmd, runs):
+    """Return the median wall time of cmd in milliseconds"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def loaded_heavy_modules(argv):
+    """Run argv through the probe and return the heavy modules it imported"""
+    probe = PROBE.format(heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, '-c', probe] + argv, cwd=HERE,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    for line in proc.stderr.splitlines():
+        if line.startswith('LOADED:'):
+            return [m for m in line[len('LOADED:'):].split(',') if m]
+    raise RuntimeError(f"Probe failed for {argv}:\n{proc.stderr}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check converter startup time against a budget")
+    parser.add_argument('--runs', type=int, default=15, help='Runs per entry point (default: 15)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as empty_dir:
+        cases = {
+            'json2excel.py --help': ['json2excel.py', '--help'],
+            'json2excel.py <empty dir>': ['json2excel.py', empty_dir],
+            'json2html.py': ['json2html.py'],
+            'json2pdf.py': ['json2pdf.py'],
+        }
+
+        baseline = time_command([sys.executable, '-c', 'pass'], args.runs)
+        print(f"{'bare interpreter':<28} {baseline:8.1f} ms")
+
+        failed = False
+        for name, argv in cases.items():
+            elapsed = time_command([sys.executable] + argv, args.runs)
+            overhead = elapsed - baseline
+            budget = BUDGET_MS[name]
+            loaded = loaded_heavy_modules(argv)
+
+            status = 'ok'
+            if overhead > budget:
+                status = f'OVER BUDGET ({budget} ms)'
+                failed = True
+            if loaded:
+                status = f'IMPORTED {", ".join(loaded)}'
+                failed = True
+
+            print(f"{name:<28} {elapsed:8.1f} ms  (+{overhead:.1f} ms)  {status}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Converters from vulnerability scan JSON to Excel, HTML and PDF reports
+
+Each writer lives in its own submodule (excel, html, pdf) and is not
+imported here, so loading the package never pulls in pandas, xlsxwriter
+or fpdf.
+"""